@@ -0,0 +1,56 @@
+import time
+
+import numpy as np
+
+from mlp import MLP
+
+# -------------------------------------------------------------------
+# Time per epoch of the NumPy MLP vs. hidden layer width and batch size
+# -------------------------------------------------------------------
+# The dataset is a noisy XOR: the four XOR corners repeated many times
+# with a little Gaussian noise added to the inputs.
+
+N_SAMPLES = 8192
+WIDTHS = [4, 16, 64, 256]
+BATCH_SIZES = [32, 256, 2048, None]  # None = full batch
+EPOCHS = 5
+DTYPES = [np.float64, np.float32]
+
+
+def noisy_xor(n_samples, noise=0.1, seed=0):
+    rng = np.random.default_rng(seed)
+    bits = rng.integers(0, 2, size=(n_samples, 2))
+    inputs = bits + rng.normal(scale=noise, size=bits.shape)
+    outputs = (bits[:, 0] ^ bits[:, 1]).reshape(-1, 1)
+    return inputs, outputs
+
+
+def time_per_epoch(width, batch_size, dtype, inputs, outputs):
+    network = MLP([2, width, 1], activations=["tanh", "sigmoid"], dtype=dtype, seed=0)
+    # One warm-up epoch so buffer allocation is not part of the timing
+    network.train(inputs, outputs, 1, batch_size=batch_size)
+    start = time.perf_counter()
+    network.train(inputs, outputs, EPOCHS, batch_size=batch_size)
+    return (time.perf_counter() - start) / EPOCHS
+
+
+def main():
+    inputs, outputs = noisy_xor(N_SAMPLES)
+    print(f"{N_SAMPLES} samples, {EPOCHS} epochs per measurement, milliseconds per epoch\n")
+    for dtype in DTYPES:
+        print(f"dtype = {np.dtype(dtype).name}")
+        header = "width".rjust(8) + "".join(
+            (f"batch {b}" if b else "full batch").rjust(14) for b in BATCH_SIZES
+        )
+        print(header)
+        for width in WIDTHS:
+            row = str(width).rjust(8)
+            for batch_size in BATCH_SIZES:
+                seconds = time_per_epoch(width, batch_size, dtype, inputs, outputs)
+                row += f"{seconds * 1000:14.2f}"
+            print(row)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+# -------------------------------------------------------------------
+# NumPy runtime vs. torch: start-up time, per-sample latency, throughput
+# -------------------------------------------------------------------
+# Start-up is measured in a fresh Python process each time: import,
+# load the model from disk and predict one sample.
+
+STARTUP_RUNS = 5
+LATENCY_SAMPLES = 2000
+BATCH_SIZE = 1_000_000
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+NUMPY_STARTUP = """
+from inference import InferenceModel
+model = InferenceModel.load({npz!r})
+model.predict([0.0, 1.0])
+"""
+
+TORCH_STARTUP = """
+import torch
+from torch_xor import XORNeuralNetwork
+model = XORNeuralNetwork()
+model.load_state_dict(torch.load({pt!r}))
+with torch.no_grad():
+    model(torch.tensor([0.0, 1.0]))
+"""
+
+
+def startup_seconds(code):
+    best = float("inf")
+    for _ in range(STARTUP_RUNS):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=HERE, check=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def time_latency_and_throughput(model, runtime, X):
+    import torch
+
+    samples = X[:LATENCY_SAMPLES]
+    with torch.no_grad():
+        tensors = torch.from_numpy(samples)
+        start = time.perf_counter()
+        for i in range(len(tensors)):
+            model(tensors[i])
+        torch_latency = (time.perf_counter() - start) / len(tensors)
+    start = time.perf_counter()
+    for i in range(len(samples)):
+        runtime.predict(samples[i])
+    numpy_latency = (time.perf_counter() - start) / len(samples)
+    print("Per-sample latency (one sample per call)")
+    print(f"  torch:  {torch_latency * 1e6:8.1f} us")
+    print(f"  numpy:  {numpy_latency * 1e6:8.1f} us\n")
+
+    with torch.no_grad():
+        tensor = torch.from_numpy(X)
+        start = time.perf_counter()
+        model(tensor)
+        torch_batch = time.perf_counter() - start
+    start = time.perf_counter()
+    runtime.predict(X)
+    numpy_batch = time.perf_counter() - start
+    print(f"Batched prediction ({BATCH_SIZE} samples)")
+    print(f"  torch:  {BATCH_SIZE / torch_batch / 1e6:8.2f} M samples/s")
+    print(f"  numpy:  {BATCH_SIZE / numpy_batch / 1e6:8.2f} M samples/s")
+
+
+def main():
+    import torch
+    from export_model import XOR_ACTIVATIONS, export_torch_model, train_xor_model
+    from inference import InferenceModel
+
+    with tempfile.TemporaryDirectory() as tmp:
+        npz_path = os.path.join(tmp, "xor_model.npz")
+        pt_path = os.path.join(tmp, "xor_model.pt")
+        model = train_xor_model()
+        export_torch_model(model, npz_path, XOR_ACTIVATIONS)
+        torch.save(model.state_dict(), pt_path)
+        runtime = InferenceModel.load(npz_path)
+
+        # Outputs have to match before any timing means anything
+        X = np.random.default_rng(0).random((BATCH_SIZE, 2), dtype=np.float32)
+        with torch.no_grad():
+            expected = model(torch.from_numpy(X)).numpy()
+        max_diff = np.max(np.abs(runtime.predict(X) - expected))
+        print(f"Max difference from torch over {BATCH_SIZE} samples: {max_diff:.2e}\n")
+
+        print(f"Start-up (fresh process, best of {STARTUP_RUNS})")
+        print(f"  torch:  {startup_seconds(TORCH_STARTUP.format(pt=pt_path)) * 1000:8.1f} ms")
+        print(f"  numpy:  {startup_seconds(NUMPY_STARTUP.format(npz=npz_path)) * 1000:8.1f} ms\n")
+
+        time_latency_and_throughput(model, runtime, X)
+
+        # The weights are memory-mapped from npz_path; drop them before the
+        # directory is removed (Windows refuses to delete a mapped file)
+        del runtime
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import os
+import time
+
+import torch
+import torch.nn as nn
+
+from torch_runner import NoisyXORDataset, evaluate, make_loader, make_optimizer, set_threads, train_one_epoch
+from torch_xor import XORNeuralNetwork
+
+# -------------------------------------------------------------------
+# CPU throughput of the torch runner, in samples per second
+# -------------------------------------------------------------------
+# One training epoch per configuration over TRAIN_SAMPLES noisy XOR
+# samples, then evaluation over EVAL_SAMPLES.
+
+TRAIN_SAMPLES = 500_000
+PER_SAMPLE_SAMPLES = 50_000  # the per-sample loader is much slower
+EVAL_SAMPLES = 2_000_000
+BATCH_SIZES = [256, 4096, 65536]
+THREAD_COUNTS = sorted({1, 2, 4, os.cpu_count() or 1})
+EVAL_BATCH_SIZE = 65536
+
+
+def train_throughput(dataset, batch_size, per_sample=False):
+    torch.manual_seed(0)
+    model = XORNeuralNetwork()
+    optimizer = make_optimizer("adam", model, 0.01)
+    loader = make_loader(dataset, batch_size, per_sample=per_sample)
+    start = time.perf_counter()
+    n_samples = train_one_epoch(model, loader, nn.MSELoss(), optimizer)
+    return n_samples / (time.perf_counter() - start)
+
+
+def no_grad_throughput(model, dataset, batch_size):
+    # Same as evaluate() but with no_grad instead of inference_mode
+    start = time.perf_counter()
+    with torch.no_grad():
+        for i in range(0, len(dataset), batch_size):
+            model(dataset.inputs[i:i + batch_size])
+    return len(dataset) / (time.perf_counter() - start)
+
+
+def main():
+    train_set = NoisyXORDataset(TRAIN_SAMPLES)
+    small_train_set = NoisyXORDataset(PER_SAMPLE_SAMPLES)
+    eval_set = NoisyXORDataset(EVAL_SAMPLES, seed=1)
+    model = XORNeuralNetwork().eval()
+
+    print(f"{os.cpu_count()} CPUs, samples per second\n")
+    header = f"{'threads':>8}" + "".join(f"{f'train bs={b}':>18}" for b in BATCH_SIZES)
+    header += f"{'train per-sample':>18}{'eval no_grad':>16}{'eval inference':>16}"
+    print(header)
+    for threads in THREAD_COUNTS:
+        set_threads(threads)
+        row = f"{threads:>8}"
+        for batch_size in BATCH_SIZES:
+            row += f"{train_throughput(train_set, batch_size):>18,.0f}"
+        row += f"{train_throughput(small_train_set, BATCH_SIZES[0], per_sample=True):>18,.0f}"
+
+        evaluate(model, eval_set, EVAL_BATCH_SIZE)  # warm-up
+        row += f"{no_grad_throughput(model, eval_set, EVAL_BATCH_SIZE):>16,.0f}"
+        start = time.perf_counter()
+        evaluate(model, eval_set, EVAL_BATCH_SIZE)
+        row += f"{EVAL_SAMPLES / (time.perf_counter() - start):>16,.0f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
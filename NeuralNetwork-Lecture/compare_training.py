@@ -0,0 +1,108 @@
+import numpy as np
+
+from mlp import MLP, OPTIMIZERS
+from training import constant, cosine_decay, fit, step_decay
+
+# -------------------------------------------------------------------
+# Epochs to converge and wall time: fixed-epoch SGD vs. the driver
+# -------------------------------------------------------------------
+# The baseline is what main.py / torch_xor.py used to do: 10000 epochs of
+# plain SGD, no matter what. Every other run stops as soon as the loss is
+# below TARGET_LOSS (or has plateaued). Results are averaged over SEEDS.
+
+# Already float64 (the MLP's dtype), so train_epoch never has to convert them
+inputs = np.array([[0, 0], [0, 1], [1, 0], [1, 1]], dtype=np.float64)
+outputs = np.array([[0], [1], [1], [0]], dtype=np.float64)
+
+MAX_EPOCHS = 10000
+TARGET_LOSS = 1e-3
+EVAL_EVERY = 50
+SEEDS = range(5)
+
+NUMPY_RUNS = [
+    # name, optimizer, schedule, early stopping
+    ("SGD, fixed 10000 epochs", "sgd", constant(2.0), False),
+    ("SGD + early stop", "sgd", constant(2.0), True),
+    ("Momentum + early stop", "momentum", constant(0.5), True),
+    ("Adam + early stop", "adam", constant(0.05), True),
+    ("Adam + step decay", "adam", step_decay(0.1, factor=0.5, every=500), True),
+    ("Adam + cosine decay", "adam", cosine_decay(0.1, MAX_EPOCHS), True),
+]
+
+TORCH_RUNS = [
+    ("SGD, fixed 10000 epochs", "SGD", 0.1, False),
+    ("SGD + early stop", "SGD", 0.1, True),
+    ("Adam + early stop", "Adam", 0.01, True),
+]
+
+
+def stopping_rules(early_stop):
+    if not early_stop:
+        return {}
+    return {"target_loss": TARGET_LOSS, "patience": 20, "min_delta": 1e-6}
+
+
+def numpy_run(optimizer_name, schedule, early_stop, seed):
+    network = MLP([2, 4, 1], activations="sigmoid", seed=seed)
+    optimizer = OPTIMIZERS[optimizer_name]()
+    return fit(
+        lambda lr: network.train_epoch(inputs, outputs, lr, optimizer=optimizer),
+        lambda: (network.loss(inputs, outputs), network.accuracy(inputs, outputs)),
+        MAX_EPOCHS, schedule, eval_every=EVAL_EVERY, verbose=False,
+        **stopping_rules(early_stop),
+    )
+
+
+def torch_run(optimizer_name, learning_rate, early_stop, seed):
+    import torch
+    from torch_xor import XORNeuralNetwork, make_evaluate, make_train_epoch
+
+    torch.manual_seed(seed)
+    x = torch.tensor(inputs, dtype=torch.float32)
+    y = torch.tensor(outputs, dtype=torch.float32)
+    model = XORNeuralNetwork()
+    criterion = torch.nn.MSELoss()
+    optimizer = getattr(torch.optim, optimizer_name)(model.parameters(), lr=learning_rate)
+    return fit(
+        make_train_epoch(model, criterion, optimizer, x, y),
+        make_evaluate(model, criterion, x, y),
+        MAX_EPOCHS, constant(learning_rate), eval_every=EVAL_EVERY, verbose=False,
+        **stopping_rules(early_stop),
+    )
+
+
+def print_table(title, rows):
+    print(title)
+    print(f"{'run':<26} {'epochs':>8} {'seconds':>9} {'final loss':>11} {'converged':>10}")
+    for name, reports in rows:
+        epochs = np.mean([r["epochs"] for r in reports])
+        seconds = np.mean([r["seconds"] for r in reports])
+        loss = np.mean([r["loss"] for r in reports])
+        converged = sum(r["loss"] <= TARGET_LOSS for r in reports)
+        print(f"{name:<26} {epochs:>8.0f} {seconds:>9.3f} {loss:>11.6f} "
+              f"{converged:>6}/{len(reports)}")
+    print()
+
+
+def main():
+    print(f"Averages over {len(SEEDS)} seeds, converged = loss <= {TARGET_LOSS}\n")
+    rows = [
+        (name, [numpy_run(opt, schedule, early_stop, seed) for seed in SEEDS])
+        for name, opt, schedule, early_stop in NUMPY_RUNS
+    ]
+    print_table("NumPy MLP (main.py)", rows)
+
+    try:
+        import torch  # noqa: F401
+    except ImportError:
+        print("torch is not installed, skipping the torch comparison")
+        return
+    rows = [
+        (name, [torch_run(opt, lr, early_stop, seed) for seed in SEEDS])
+        for name, opt, lr, early_stop in TORCH_RUNS
+    ]
+    print_table("Torch XORNeuralNetwork (torch_xor.py)", rows)
+
+
+if __name__ == "__main__":
+    main()
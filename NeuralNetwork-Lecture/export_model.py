@@ -0,0 +1,64 @@
+import argparse
+
+import numpy as np
+import torch
+import torch.nn as nn
+
+from inference import InferenceModel, save_model
+from torch_xor import XORNeuralNetwork, inputs, make_evaluate, make_train_epoch, outputs
+from training import constant, fit
+
+# -------------------------------------------------------------------
+# Train the torch XOR network and export it for the NumPy runtime
+# -------------------------------------------------------------------
+
+# XORNeuralNetwork.forward: ReLU, ReLU, sigmoid
+XOR_ACTIVATIONS = ["relu", "relu", "sigmoid"]
+
+
+def export_torch_model(model, path, activations):
+    """Write the nn.Linear layers of model (in definition order) to path."""
+    layers = [m for m in model.modules() if isinstance(m, nn.Linear)]
+    with torch.no_grad():
+        # nn.Linear stores weights as (outputs, inputs); the runtime wants x @ w
+        weights = [layer.weight.T.numpy() for layer in layers]
+        biases = [layer.bias.numpy() for layer in layers]
+    save_model(path, weights, biases, activations)
+
+
+def train_xor_model(seed=0):
+    torch.manual_seed(seed)
+    model = XORNeuralNetwork()
+    criterion = nn.MSELoss()
+    optimizer = torch.optim.Adam(model.parameters(), lr=0.01)
+    fit(make_train_epoch(model, criterion, optimizer, inputs, outputs),
+        make_evaluate(model, criterion, inputs, outputs),
+        max_epochs=10000, schedule=constant(0.01), eval_every=50,
+        target_loss=1e-4, verbose=False)
+    return model
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train XORNeuralNetwork and export its weights.")
+    parser.add_argument("--output", default="xor_model.npz")
+    parser.add_argument("--state-dict", help="also save the torch state_dict here")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    model = train_xor_model(args.seed)
+    export_torch_model(model, args.output, XOR_ACTIVATIONS)
+    if args.state_dict:
+        torch.save(model.state_dict(), args.state_dict)
+
+    # Check the exported model against torch
+    with torch.no_grad():
+        expected = model(inputs).numpy()
+    actual = InferenceModel.load(args.output).predict(inputs.numpy())
+    max_diff = np.max(np.abs(expected - actual))
+    print(f"Exported to {args.output}, max difference from torch: {max_diff:.2e}")
+    if not np.allclose(expected, actual, atol=1e-5):
+        raise SystemExit("exported model does not match torch")
+
+
+if __name__ == "__main__":
+    main()
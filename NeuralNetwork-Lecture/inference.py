@@ -0,0 +1,146 @@
+import io
+import struct
+import zipfile
+
+import numpy as np
+
+from mlp import ACTIVATIONS
+
+# -------------------------------------------------------------------
+# NumPy-only inference runtime
+# -------------------------------------------------------------------
+# A trained network is stored as an uncompressed .npz file:
+#
+#   layer_sizes   int array, e.g. [2, 10, 8, 1]
+#   activations   string array, one name from mlp.ACTIVATIONS per layer
+#   w0, w1, ...   float32 weights, shape (inputs, outputs) so x @ w works
+#   b0, b1, ...   float32 biases
+#
+# Because the file is not compressed, every array inside it sits at a fixed
+# byte offset, so load() can memory-map the arrays straight out of the file
+# instead of reading and copying them. save_model() pads each zip entry so
+# that offset is a multiple of ALIGNMENT; otherwise the mapped arrays would
+# be misaligned and NumPy would copy them on every matmul. The result is
+# still a normal .npz that np.load can read. Importing this module never
+# imports torch, so start-up stays cheap.
+
+ALIGNMENT = 64
+# Zip "extra field" id used for the padding (the same one Android's zipalign uses)
+_PADDING_EXTRA_ID = 0xD935
+
+
+def save_model(path, weights, biases, activations):
+    """Write a network (any framework, as NumPy arrays) in the runtime format."""
+    if not (len(weights) == len(biases) == len(activations)):
+        raise ValueError("need one weight matrix, bias and activation per layer")
+    for name in activations:
+        if name not in ACTIVATIONS:
+            raise ValueError(f"unknown activation {name!r}, choose from {sorted(ACTIVATIONS)}")
+    layer_sizes = [weights[0].shape[0]] + [w.shape[1] for w in weights]
+    arrays = {
+        "layer_sizes": np.array(layer_sizes, dtype=np.int64),
+        "activations": np.array(activations),
+    }
+    for i, (w, b) in enumerate(zip(weights, biases)):
+        arrays[f"w{i}"] = np.ascontiguousarray(w, dtype=np.float32)
+        arrays[f"b{i}"] = np.ascontiguousarray(b, dtype=np.float32).reshape(-1)
+    _write_aligned_npz(path, arrays)
+
+
+def _write_aligned_npz(path, arrays):
+    """Like np.savez, but every array's data starts at an aligned file offset."""
+    with open(path, "wb") as f, zipfile.ZipFile(f, "w", zipfile.ZIP_STORED) as archive:
+        for name, array in arrays.items():
+            npy = io.BytesIO()
+            np.lib.format.write_array(npy, array, allow_pickle=False)
+            data = npy.getvalue()
+
+            info = zipfile.ZipInfo(name + ".npy", date_time=(1980, 1, 1, 0, 0, 0))
+            # Data offset = entry start + 30-byte local header + file name
+            # + extra field (4-byte record header + padding) + .npy header
+            npy_header_length = len(data) - array.nbytes
+            offset = f.tell() + 30 + len(info.filename.encode()) + 4 + npy_header_length
+            padding = -offset % ALIGNMENT
+            info.extra = struct.pack("<HH", _PADDING_EXTRA_ID, padding) + bytes(padding)
+            archive.writestr(info, data)
+
+
+def _memmap_npz(path):
+    """Memory-map every array in an uncompressed .npz file.
+
+    Files written by save_model are aligned and mapped without copies. A
+    misaligned array (e.g. from a plain np.savez) is copied once here, rather
+    than by NumPy on every operation that uses it.
+    """
+    arrays = {}
+    with zipfile.ZipFile(path) as archive, open(path, "rb") as f:
+        for info in archive.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"{path} is compressed and cannot be memory-mapped")
+            # The member's data starts after its local file header, which is
+            # 30 bytes plus the file name and extra field.
+            f.seek(info.header_offset + 26)
+            name_length, extra_length = struct.unpack("<HH", f.read(4))
+            f.seek(info.header_offset + 30 + name_length + extra_length)
+            # Then comes a regular .npy header describing the array
+            if np.lib.format.read_magic(f) == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+            array = np.memmap(path, dtype=dtype, mode="r", offset=f.tell(), shape=shape,
+                              order="F" if fortran_order else "C")
+            if not array.flags["ALIGNED"]:
+                array = np.array(array)
+            arrays[info.filename[:-len(".npy")]] = array
+    return arrays
+
+
+class InferenceModel:
+    def __init__(self, weights, biases, activations):
+        self.weights = weights
+        self.biases = biases
+        self.activations = list(activations)
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """Load a model written by save_model.
+
+        With mmap=True the weights are memory-mapped read-only from the file;
+        otherwise they are read into memory with np.load.
+        """
+        if mmap:
+            arrays = _memmap_npz(path)
+        else:
+            with np.load(path) as npz:
+                arrays = dict(npz)
+        n_layers = len(arrays["layer_sizes"]) - 1
+        return cls(
+            [arrays[f"w{i}"] for i in range(n_layers)],
+            [arrays[f"b{i}"] for i in range(n_layers)],
+            [str(name) for name in arrays["activations"]],
+        )
+
+    def predict(self, X, batch_size=65536):
+        """Vectorized prediction for a batch of inputs, batch_size rows at a time.
+
+        A 1-D X is treated as a single sample and gives a single output row.
+        """
+        X = np.asarray(X, dtype=np.float32)
+        shape = X.shape
+        single = X.ndim == 1
+        if single:
+            X = X.reshape(1, -1)
+        n_inputs = self.weights[0].shape[0]
+        if X.ndim != 2 or X.shape[1] != n_inputs:
+            raise ValueError(f"expected inputs of shape (n, {n_inputs}), got {shape}")
+
+        result = np.empty((len(X), self.weights[-1].shape[1]), dtype=np.float32)
+        with np.errstate(over="ignore"):
+            for start in range(0, len(X), batch_size):
+                x = X[start:start + batch_size]
+                for w, b, name in zip(self.weights, self.biases, self.activations):
+                    x = x @ w
+                    x += b
+                    ACTIVATIONS[name][0](x)
+                result[start:start + len(x)] = x
+        return result[0] if single else result
@@ -1,12 +1,7 @@
 import numpy as np
 
-# Activation function: Sigmoid
-def sigmoid(x):
-    return 1 / (1 + np.exp(-x))
-
-# Derivative of sigmoid function
-def sigmoid_derivative(x):
-    return x * (1 - x)
+from mlp import MLP, Adam
+from training import constant, fit
 
 # Training Data
 inputs = np.array([
@@ -14,7 +9,7 @@ inputs = np.array([
     [0, 1],
     [1, 0],
     [1, 1]
-])
+], dtype=np.float64)
 
 # Expected Output (XOR problem)
 outputs = np.array([
@@ -22,44 +17,35 @@ outputs = np.array([
     [1],
     [1],
     [0]
-])
+], dtype=np.float64)
 
-# Initialize weights randomly with mean 0
-np.random.seed(1)
-weights_input_hidden = np.random.rand(2, 4) - 0.5  # input to hidden layer
-weights_hidden_output = np.random.rand(4, 1) - 0.5  # hidden to output layer
+# 2 inputs -> 4 hidden nodes -> 1 output, sigmoid everywhere.
+# Weights are initialized randomly with mean 0.
+network = MLP([2, 4, 1], activations="sigmoid", seed=1)
 
 # Hyperparameters
-learning_rate = 0.1
-epochs = 10000
-
-# Training loop
-for epoch in range(epochs):
-    # Forward Propagation
-    hidden_input = np.dot(inputs, weights_input_hidden)
-    hidden_output = sigmoid(hidden_input)
-    
-    final_input = np.dot(hidden_output, weights_hidden_output)
-    final_output = sigmoid(final_input)
-    
-    # Calculate error
-    error = outputs - final_output
-    if epoch % 2000 == 0:
-        print(f"Epoch {epoch}, Error: {np.mean(np.abs(error))}")
-    
-    # Backpropagation
-    d_output = error * sigmoid_derivative(final_output)
-    
-    error_hidden_layer = d_output.dot(weights_hidden_output.T)
-    d_hidden_layer = error_hidden_layer * sigmoid_derivative(hidden_output)
-    
-    # Update weights
-    weights_hidden_output += hidden_output.T.dot(d_output) * learning_rate
-    weights_input_hidden += inputs.T.dot(d_hidden_layer) * learning_rate
-
-# Testing the neural network after training
+learning_rate = 0.05
+max_epochs = 10000
+
+# Training loop: full batch with the Adam optimizer. The loss is only
+# checked every 100 epochs, and training stops once it is below 0.001 or
+# has stopped improving.
+optimizer = Adam()
+report = fit(
+    lambda lr: network.train_epoch(inputs, outputs, lr, optimizer=optimizer),
+    lambda: (network.loss(inputs, outputs), network.accuracy(inputs, outputs)),
+    max_epochs=max_epochs,
+    schedule=constant(learning_rate),
+    eval_every=100,
+    target_loss=1e-3,
+    patience=20,
+    min_delta=1e-6,
+)
+print(f"Stopped after {report['epochs']} epochs ({report['stop_reason']}) "
+      f"in {report['seconds']:.3f}s")
+
+# Testing the neural network after training (all samples in one batch)
 print("\nTesting neural network on training data:")
+predictions = network.predict(inputs)
 for i in range(len(inputs)):
-    hidden_output = sigmoid(np.dot(inputs[i], weights_input_hidden))
-    final_output = sigmoid(np.dot(hidden_output, weights_hidden_output))
-    print(f"Input: {inputs[i]}, Predicted Output: {final_output[0]:.4f}, Expected Output: {outputs[i][0]}")
+    print(f"Input: {inputs[i]}, Predicted Output: {predictions[i][0]:.4f}, Expected Output: {outputs[i][0]}")
@@ -0,0 +1,315 @@
+import numpy as np
+
+# -------------------------------------------------------------------
+# Activation functions
+# -------------------------------------------------------------------
+# Every activation works in place on its input buffer, and every
+# derivative is written in terms of the activation's *output* (just like
+# sigmoid_derivative(x) = x * (1 - x) in the original XOR script), so the
+# backward pass never needs to keep the pre-activation values around.
+
+def sigmoid_(z):
+    np.negative(z, out=z)
+    np.exp(z, out=z)
+    z += 1
+    np.reciprocal(z, out=z)
+
+def sigmoid_grad_(a, out):
+    # a * (1 - a)
+    np.subtract(1, a, out=out)
+    out *= a
+
+def tanh_(z):
+    np.tanh(z, out=z)
+
+def tanh_grad_(a, out):
+    # 1 - a^2
+    np.multiply(a, a, out=out)
+    np.subtract(1, out, out=out)
+
+def relu_(z):
+    np.maximum(z, 0, out=z)
+
+def relu_grad_(a, out):
+    np.greater(a, 0, out=out)
+
+def identity_(z):
+    pass
+
+def identity_grad_(a, out):
+    out.fill(1)
+
+ACTIVATIONS = {
+    "sigmoid": (sigmoid_, sigmoid_grad_),
+    "tanh": (tanh_, tanh_grad_),
+    "relu": (relu_, relu_grad_),
+    "identity": (identity_, identity_grad_),
+}
+
+
+# -------------------------------------------------------------------
+# Optimizers
+# -------------------------------------------------------------------
+# step() updates every parameter in place. Gradients are used as scratch
+# space and are overwritten, and any per-parameter state is allocated on the
+# first step and reused afterwards.
+
+class SGD:
+    def step(self, params, grads, learning_rate):
+        for p, g in zip(params, grads):
+            g *= learning_rate
+            p -= g
+
+
+class Momentum:
+    def __init__(self, beta=0.9):
+        self.beta = beta
+        self.velocity = None
+
+    def step(self, params, grads, learning_rate):
+        if self.velocity is None:
+            self.velocity = [np.zeros_like(p) for p in params]
+        for p, g, v in zip(params, grads, self.velocity):
+            # v = beta * v + g;  p -= learning_rate * v
+            v *= self.beta
+            v += g
+            np.multiply(v, learning_rate, out=g)
+            p -= g
+
+
+class Adam:
+    def __init__(self, beta1=0.9, beta2=0.999, eps=1e-8):
+        self.beta1 = beta1
+        self.beta2 = beta2
+        self.eps = eps
+        self.t = 0
+        self.m = self.v = self.scratch = None
+
+    def step(self, params, grads, learning_rate):
+        if self.m is None:
+            self.m = [np.zeros_like(p) for p in params]
+            self.v = [np.zeros_like(p) for p in params]
+            self.scratch = [np.empty_like(p) for p in params]
+        self.t += 1
+        # Bias correction folded into the step size
+        step_size = learning_rate * (1 - self.beta2 ** self.t) ** 0.5 / (1 - self.beta1 ** self.t)
+        for p, g, m, v, s in zip(params, grads, self.m, self.v, self.scratch):
+            # v = beta2 * v + (1 - beta2) * g^2
+            v *= self.beta2
+            np.multiply(g, g, out=s)
+            s *= 1 - self.beta2
+            v += s
+            # m = beta1 * m + (1 - beta1) * g
+            m *= self.beta1
+            g *= 1 - self.beta1
+            m += g
+            # p -= step_size * m / (sqrt(v) + eps)
+            np.sqrt(v, out=s)
+            s += self.eps
+            np.divide(m, s, out=s)
+            s *= step_size
+            p -= s
+
+
+OPTIMIZERS = {"sgd": SGD, "momentum": Momentum, "adam": Adam}
+
+
+# -------------------------------------------------------------------
+# Multi-layer perceptron
+# -------------------------------------------------------------------
+class MLP:
+    """Fully connected network trained with mean squared error.
+
+    layer_sizes: e.g. [2, 4, 1] for 2 inputs, one hidden layer of 4 nodes
+                 and 1 output.
+    activations: one name per weight layer, or a single name for all of them.
+    """
+
+    def __init__(self, layer_sizes, activations="sigmoid", dtype=np.float64, seed=None):
+        if len(layer_sizes) < 2:
+            raise ValueError("layer_sizes needs at least an input and an output size")
+        n_layers = len(layer_sizes) - 1
+        if isinstance(activations, str):
+            activations = [activations] * n_layers
+        if len(activations) != n_layers:
+            raise ValueError(f"expected {n_layers} activations, got {len(activations)}")
+        for name in activations:
+            if name not in ACTIVATIONS:
+                raise ValueError(f"unknown activation {name!r}, choose from {sorted(ACTIVATIONS)}")
+
+        self.layer_sizes = list(layer_sizes)
+        self.activations = list(activations)
+        self.dtype = np.dtype(dtype)
+
+        # Initialize weights randomly with mean 0 (same scheme as the lecture script)
+        rng = np.random.default_rng(seed)
+        self.weights = [
+            (rng.random((n_in, n_out)) - 0.5).astype(self.dtype)
+            for n_in, n_out in zip(layer_sizes[:-1], layer_sizes[1:])
+        ]
+        self.biases = [np.zeros(n_out, dtype=self.dtype) for n_out in layer_sizes[1:]]
+        # Updated in place by the optimizers, so these lists never go stale
+        self._params = self.weights + self.biases
+
+        self._capacity = 0
+        self._order = np.arange(0)
+        self._rng = rng
+
+    # ---------------------------------------------------------------
+    # Buffers
+    # ---------------------------------------------------------------
+    def _allocate(self, batch_size):
+        """(Re)allocate the activation and gradient buffers for batch_size rows.
+
+        Buffers only grow, so a smaller final mini-batch just uses a view of
+        the first rows and nothing is allocated inside the training loop.
+        """
+        if batch_size <= self._capacity:
+            return
+        self._capacity = batch_size
+        # acts[0] holds the input batch, acts[i + 1] the output of layer i
+        self._acts = [np.empty((batch_size, n), dtype=self.dtype) for n in self.layer_sizes]
+        self._deltas = [np.empty((batch_size, n), dtype=self.dtype) for n in self.layer_sizes[1:]]
+        self._scratch = [np.empty((batch_size, n), dtype=self.dtype) for n in self.layer_sizes[1:]]
+        self._targets = np.empty((batch_size, self.layer_sizes[-1]), dtype=self.dtype)
+        self.grad_weights = [np.empty_like(w) for w in self.weights]
+        self.grad_biases = [np.empty_like(b) for b in self.biases]
+        self._grads = self.grad_weights + self.grad_biases
+
+    # ---------------------------------------------------------------
+    # Forward / backward
+    # ---------------------------------------------------------------
+    def _forward(self, n):
+        """Run the network on the first n rows of acts[0]; returns the output view."""
+        for i, (w, b) in enumerate(zip(self.weights, self.biases)):
+            z = self._acts[i + 1][:n]
+            np.matmul(self._acts[i][:n], w, out=z)
+            z += b
+            ACTIVATIONS[self.activations[i]][0](z)
+        return self._acts[-1][:n]
+
+    def _backward(self, n):
+        """Fill grad_weights / grad_biases from the last forward pass.
+
+        Gradients are of the mean squared error over the n rows in the batch.
+        """
+        out = self._acts[-1][:n]
+        delta = self._deltas[-1][:n]
+        # dLoss/dOutput = (output - expected) * 2 / (n * n_outputs)
+        np.subtract(out, self._targets[:n], out=delta)
+        delta *= 2.0 / (n * out.shape[1])
+
+        for i in range(len(self.weights) - 1, -1, -1):
+            delta = self._deltas[i][:n]
+            scratch = self._scratch[i][:n]
+            ACTIVATIONS[self.activations[i]][1](self._acts[i + 1][:n], scratch)
+            delta *= scratch
+
+            np.matmul(self._acts[i][:n].T, delta, out=self.grad_weights[i])
+            np.sum(delta, axis=0, out=self.grad_biases[i])
+            if i > 0:
+                # Push the error back through this layer's weights
+                np.matmul(delta, self.weights[i].T, out=self._deltas[i - 1][:n])
+
+    def _load_batch(self, X, y, start, n, order=None):
+        """Copy n rows (order[start:start + n], or just the next n) into the buffers."""
+        if order is None:
+            self._acts[0][:n] = X[start:start + n]
+            self._targets[:n] = y[start:start + n]
+        else:
+            idx = order[start:start + n]
+            np.take(X, idx, axis=0, out=self._acts[0][:n])
+            np.take(y, idx, axis=0, out=self._targets[:n])
+
+    # ---------------------------------------------------------------
+    # Public API
+    # ---------------------------------------------------------------
+    def _as_2d(self, a):
+        a = np.asarray(a, dtype=self.dtype)
+        return a.reshape(len(a), -1)
+
+    def train(self, X, y, epochs, learning_rate=0.1, batch_size=None, shuffle=True,
+              log_every=0, seed=None, optimizer=None):
+        """Train with (mini-batch) gradient descent.
+
+        batch_size=None trains on the full dataset each step. seed fixes the
+        shuffle order; without it the model's own generator (seeded by the
+        seed given to MLP) is used, so a seeded MLP trains reproducibly.
+        optimizer defaults to plain SGD. Returns the list of (epoch, loss)
+        pairs that were logged.
+        """
+        X = self._as_2d(X)
+        y = self._as_2d(y)
+        optimizer = optimizer or SGD()
+        rng = self._rng if seed is None else np.random.default_rng(seed)
+        history = []
+        for epoch in range(epochs):
+            self.train_epoch(X, y, learning_rate, batch_size, shuffle, rng, optimizer)
+            if log_every and epoch % log_every == 0:
+                loss = self.loss(X, y)
+                history.append((epoch, loss))
+                print(f"Epoch {epoch}, Loss: {loss}")
+        return history
+
+    def train_epoch(self, X, y, learning_rate, batch_size=None, shuffle=True, rng=None,
+                    optimizer=None):
+        """One pass over the data, one optimizer step per mini-batch.
+
+        Pass X and y already in the model's dtype to avoid a conversion on
+        every call; the shuffle order and all buffers are reused across calls.
+        """
+        X = self._as_2d(X)
+        y = self._as_2d(y)
+        optimizer = optimizer or SGD()
+        n_samples = len(X)
+        batch_size = n_samples if batch_size is None else min(batch_size, n_samples)
+        self._allocate(batch_size)
+
+        order = None
+        if shuffle and batch_size < n_samples:
+            if len(self._order) != n_samples:
+                self._order = np.arange(n_samples)
+            (rng or self._rng).shuffle(self._order)
+            order = self._order
+
+        with np.errstate(over="ignore"):
+            for start in range(0, n_samples, batch_size):
+                n = min(batch_size, n_samples - start)
+                self._load_batch(X, y, start, n, order)
+                self._forward(n)
+                self._backward(n)
+                optimizer.step(self._params, self._grads, learning_rate)
+
+    def predict(self, X, batch_size=4096):
+        """Run the network on every row of X, batch_size rows at a time.
+
+        A 1-D X is treated as a single sample and gives a single output row.
+        """
+        X = np.asarray(X, dtype=self.dtype)
+        shape = X.shape
+        single = X.ndim == 1
+        if single:
+            X = X.reshape(1, -1)
+        if X.ndim != 2 or X.shape[1] != self.layer_sizes[0]:
+            raise ValueError(f"expected inputs of shape (n, {self.layer_sizes[0]}), got {shape}")
+
+        result = np.empty((len(X), self.layer_sizes[-1]), dtype=self.dtype)
+        if len(X):
+            self._allocate(min(batch_size, len(X)))
+            step = self._capacity
+            with np.errstate(over="ignore"):
+                for start in range(0, len(X), step):
+                    chunk = X[start:start + step]
+                    n = len(chunk)
+                    self._acts[0][:n] = chunk
+                    result[start:start + n] = self._forward(n)
+        return result[0] if single else result
+
+    def loss(self, X, y):
+        """Mean squared error over the whole dataset."""
+        error = self.predict(X) - self._as_2d(y)
+        return float(np.mean(error * error))
+
+    def accuracy(self, X, y):
+        """Fraction of outputs that round to the expected 0/1 value."""
+        return float(np.mean(np.round(self.predict(X)) == self._as_2d(y)))
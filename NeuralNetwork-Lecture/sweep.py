@@ -0,0 +1,296 @@
+import argparse
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from mlp import ACTIVATIONS, MLP
+
+# -------------------------------------------------------------------
+# Seed / learning rate sweeps for the XOR networks
+# -------------------------------------------------------------------
+# Instead of training one tiny network per run, N independent networks are
+# trained together: every weight matrix gets a leading "network" axis, so
+# one batched matmul does the work of N small ones. Each network keeps its
+# own seed and learning rate, and a network's gradient only depends on its
+# own weights, so the results match training them one by one.
+
+# XOR data
+INPUTS = np.array([[0, 0], [0, 1], [1, 0], [1, 1]], dtype=np.float64)
+OUTPUTS = np.array([[0], [1], [1], [0]], dtype=np.float64)
+
+# Same architecture as main.py; the torch backend uses XORNeuralNetwork itself
+NUMPY_LAYERS = [2, 4, 1]
+NUMPY_ACTIVATIONS = ["sigmoid", "sigmoid"]
+
+
+def make_configs(seeds, learning_rates):
+    return [{"seed": s, "learning_rate": lr} for lr in learning_rates for s in seeds]
+
+
+def summarize(configs, losses, predictions, converged_epoch):
+    """One result dict per network in the stack."""
+    accuracy = np.mean(np.round(predictions) == OUTPUTS, axis=(1, 2))
+    return [
+        {
+            **config,
+            "final_loss": float(losses[k]),
+            "accuracy": float(accuracy[k]),
+            "converged_epoch": int(converged_epoch[k]) if converged_epoch[k] >= 0 else None,
+        }
+        for k, config in enumerate(configs)
+    ]
+
+
+# -------------------------------------------------------------------
+# NumPy backend: stacked weights, batched matmul
+# -------------------------------------------------------------------
+def train_numpy_stack(configs, epochs, check_every=100, tolerance=1e-3):
+    n_nets = len(configs)
+    n_samples = len(INPUTS)
+
+    # Stack the initial weights of N MLPs, so network k starts exactly like
+    # MLP(NUMPY_LAYERS, seed=configs[k]["seed"]) would.
+    nets = [MLP(NUMPY_LAYERS, NUMPY_ACTIVATIONS, seed=c["seed"]) for c in configs]
+    weights = [np.stack(layer) for layer in zip(*(net.weights for net in nets))]
+    biases = [np.stack(layer) for layer in zip(*(net.biases for net in nets))]
+    learning_rate = np.array([c["learning_rate"] for c in configs]).reshape(-1, 1, 1)
+
+    # Preallocated buffers, all with the network axis first: (N, samples, nodes)
+    acts = [INPUTS] + [np.empty((n_nets, n_samples, n)) for n in NUMPY_LAYERS[1:]]
+    deltas = [np.empty((n_nets, n_samples, n)) for n in NUMPY_LAYERS[1:]]
+    scratch = [np.empty((n_nets, n_samples, n)) for n in NUMPY_LAYERS[1:]]
+    grad_weights = [np.empty_like(w) for w in weights]
+    grad_biases = [np.empty_like(b) for b in biases]
+
+    converged_epoch = np.full(n_nets, -1)
+    n_layers = len(weights)
+
+    with np.errstate(over="ignore"):
+        for epoch in range(epochs + 1):
+            # Forward: (samples, in) @ (N, in, out) broadcasts to (N, samples, out)
+            for i in range(n_layers):
+                np.matmul(acts[i], weights[i], out=acts[i + 1])
+                acts[i + 1] += biases[i][:, None, :]
+                ACTIVATIONS[NUMPY_ACTIVATIONS[i]][0](acts[i + 1])
+
+            np.subtract(acts[-1], OUTPUTS, out=deltas[-1])
+            if epoch % check_every == 0 or epoch == epochs:
+                losses = np.mean(deltas[-1] ** 2, axis=(1, 2))
+                newly_converged = (losses < tolerance) & (converged_epoch < 0)
+                converged_epoch[newly_converged] = epoch
+            if epoch == epochs:
+                break
+
+            # Backward, same maths as MLP._backward with a leading network axis
+            deltas[-1] *= 2.0 / (n_samples * NUMPY_LAYERS[-1])
+            for i in range(n_layers - 1, -1, -1):
+                ACTIVATIONS[NUMPY_ACTIVATIONS[i]][1](acts[i + 1], scratch[i])
+                deltas[i] *= scratch[i]
+                np.matmul(acts[i].swapaxes(-1, -2), deltas[i], out=grad_weights[i])
+                np.sum(deltas[i], axis=1, out=grad_biases[i])
+                if i > 0:
+                    np.matmul(deltas[i], weights[i].swapaxes(-1, -2), out=deltas[i - 1])
+
+            for w, b, gw, gb in zip(weights, biases, grad_weights, grad_biases):
+                gw *= learning_rate
+                gb *= learning_rate[:, :, 0]
+                w -= gw
+                b -= gb
+
+    return summarize(configs, losses, acts[-1], converged_epoch)
+
+
+# -------------------------------------------------------------------
+# Torch backend: batched parameters, torch.baddbmm
+# -------------------------------------------------------------------
+def train_torch_stack(configs, epochs, check_every=100, tolerance=1e-3):
+    import torch
+    from torch_xor import XORNeuralNetwork
+
+    n_nets = len(configs)
+    inputs = torch.tensor(INPUTS, dtype=torch.float32).expand(n_nets, -1, -1)
+    outputs = torch.tensor(OUTPUTS, dtype=torch.float32)
+
+    # Stack the initial weights of N XORNeuralNetworks, so network k starts
+    # exactly like torch.manual_seed(configs[k]["seed"]); XORNeuralNetwork().
+    per_net_weights, per_net_biases = [], []
+    for config in configs:
+        torch.manual_seed(config["seed"])
+        model = XORNeuralNetwork()
+        layers = [model.hidden1, model.hidden2, model.output]
+        # nn.Linear stores weights as (outputs, inputs); baddbmm wants x @ w
+        per_net_weights.append([layer.weight.detach().T for layer in layers])
+        per_net_biases.append([layer.bias.detach().unsqueeze(0) for layer in layers])
+    weights = [torch.stack(layer).requires_grad_() for layer in zip(*per_net_weights)]
+    biases = [torch.stack(layer).requires_grad_() for layer in zip(*per_net_biases)]
+    parameters = weights + biases
+    learning_rate = torch.tensor([c["learning_rate"] for c in configs]).view(-1, 1, 1)
+
+    converged_epoch = np.full(n_nets, -1)
+    for epoch in range(epochs + 1):
+        x = inputs
+        for i, (w, b) in enumerate(zip(weights, biases)):
+            x = torch.baddbmm(b, x, w)
+            # ReLU on the hidden layers, sigmoid on the output (like XORNeuralNetwork)
+            x = torch.sigmoid(x) if i == len(weights) - 1 else torch.relu(x)
+
+        losses = ((x - outputs) ** 2).mean(dim=(1, 2))
+        if epoch % check_every == 0 or epoch == epochs:
+            newly_converged = (losses.detach().numpy() < tolerance) & (converged_epoch < 0)
+            converged_epoch[newly_converged] = epoch
+        if epoch == epochs:
+            break
+
+        # Summing the per-network losses keeps every network's gradient separate
+        losses.sum().backward()
+        with torch.no_grad():
+            for p in parameters:
+                p -= learning_rate * p.grad
+                p.grad = None
+
+    return summarize(configs, losses.detach().numpy(), x.detach().numpy(), converged_epoch)
+
+
+BACKENDS = {"numpy": train_numpy_stack, "torch": train_torch_stack}
+
+
+# -------------------------------------------------------------------
+# Running a sweep
+# -------------------------------------------------------------------
+# BLAS / OpenMP thread pools read these when NumPy (or torch) is imported
+THREAD_ENV_VARS = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS")
+
+
+def _single_threaded(backend):
+    # Many small worker processes beat one process with many threads here.
+    # Only torch workers import torch: that import alone takes over a second.
+    if backend == "torch":
+        import torch
+        torch.set_num_threads(1)
+
+
+def run_sweep(backend, configs, epochs, workers=1, **kwargs):
+    """Train every config, split into one stack per worker process.
+
+    Workers are spawned (not forked) with THREAD_ENV_VARS set to 1, so each
+    one imports NumPy fresh with a single-threaded BLAS.
+    """
+    train = BACKENDS[backend]
+    if workers <= 1:
+        return train(configs, epochs, **kwargs)
+
+    chunks = [chunk.tolist() for chunk in np.array_split(np.array(configs, dtype=object), workers)]
+    chunks = [chunk for chunk in chunks if chunk]
+    saved_env = {name: os.environ.get(name) for name in THREAD_ENV_VARS}
+    os.environ.update(dict.fromkeys(THREAD_ENV_VARS, "1"))
+    try:
+        with ProcessPoolExecutor(max_workers=len(chunks),
+                                 mp_context=multiprocessing.get_context("spawn"),
+                                 initializer=_single_threaded, initargs=(backend,)) as pool:
+            futures = [pool.submit(train, chunk, epochs, **kwargs) for chunk in chunks]
+            return [result for future in futures for result in future.result()]
+    finally:
+        for name, value in saved_env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def train_numpy_one(config, epochs):
+    """main.py's way: one MLP, full-batch SGD through MLP.train."""
+    network = MLP(NUMPY_LAYERS, NUMPY_ACTIVATIONS, seed=config["seed"])
+    network.train(INPUTS, OUTPUTS, epochs, learning_rate=config["learning_rate"])
+
+
+def train_torch_one(config, epochs):
+    """torch_xor.py's way: one XORNeuralNetwork trained with optim.SGD."""
+    import torch
+    from torch_xor import XORNeuralNetwork
+
+    torch.manual_seed(config["seed"])
+    model = XORNeuralNetwork()
+    criterion = torch.nn.MSELoss()
+    optimizer = torch.optim.SGD(model.parameters(), lr=config["learning_rate"])
+    inputs = torch.tensor(INPUTS, dtype=torch.float32)
+    outputs = torch.tensor(OUTPUTS, dtype=torch.float32)
+    for _ in range(epochs):
+        loss = criterion(model(inputs), outputs)
+        optimizer.zero_grad()
+        loss.backward()
+        optimizer.step()
+
+
+SINGLE_NETWORK = {
+    "numpy": (train_numpy_one, "MLP.train"),
+    "torch": (train_torch_one, "XORNeuralNetwork + optim.SGD"),
+}
+
+
+def run_one_by_one(backend, configs, epochs):
+    """The old way: the regular single-network code, one network after the other."""
+    train, _ = SINGLE_NETWORK[backend]
+    for config in configs:
+        train(config, epochs)
+
+
+def print_results(results):
+    print(f"{'seed':>6} {'lr':>8} {'final loss':>12} {'accuracy':>9} {'converged at':>13}")
+    for r in results:
+        converged = r["converged_epoch"] if r["converged_epoch"] is not None else "-"
+        print(f"{r['seed']:>6} {r['learning_rate']:>8g} {r['final_loss']:>12.6f} "
+              f"{r['accuracy']:>9.2f} {converged:>13}")
+
+    n_converged = sum(r["converged_epoch"] is not None for r in results)
+    print(f"\n{n_converged}/{len(results)} networks converged")
+    best = min(results, key=lambda r: r["final_loss"])
+    print(f"Best: seed {best['seed']}, learning rate {best['learning_rate']:g}, "
+          f"loss {best['final_loss']:.6f}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Train many XOR networks at once.")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default="numpy")
+    parser.add_argument("--seeds", type=int, default=16, help="number of seeds (0..N-1)")
+    parser.add_argument("--lrs", default="0.5,1,2,4",
+                        help="comma separated learning rates")
+    parser.add_argument("--epochs", type=int, default=10000)
+    parser.add_argument("--workers", type=int, default=1, help="worker processes")
+    parser.add_argument("--check-every", type=int, default=100,
+                        help="epochs between convergence checks")
+    parser.add_argument("--tolerance", type=float, default=1e-3,
+                        help="loss below which a network counts as converged")
+    parser.add_argument("--compare", action="store_true",
+                        help="also time the single-network code (MLP.train or "
+                             "XORNeuralNetwork + optim.SGD) on every config, one at a time")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    learning_rates = [float(lr) for lr in args.lrs.split(",")]
+    configs = make_configs(range(args.seeds), learning_rates)
+    kwargs = {"check_every": args.check_every, "tolerance": args.tolerance}
+
+    start = time.perf_counter()
+    results = run_sweep(args.backend, configs, args.epochs, workers=args.workers, **kwargs)
+    batched_time = time.perf_counter() - start
+    print_results(results)
+
+    print(f"\nBatched: {len(configs)} networks in {batched_time:.2f}s "
+          f"({len(configs) / batched_time:.1f} networks/s)")
+    if args.compare:
+        start = time.perf_counter()
+        run_one_by_one(args.backend, configs, args.epochs)
+        sequential_time = time.perf_counter() - start
+        print(f"One by one ({SINGLE_NETWORK[args.backend][1]}): "
+              f"{len(configs)} networks in {sequential_time:.2f}s "
+              f"({len(configs) / sequential_time:.1f} networks/s)")
+        print(f"Speedup: {sequential_time / batched_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+import argparse
+import os
+import time
+
+import torch
+import torch.nn as nn
+from torch.utils.data import DataLoader, Dataset, TensorDataset
+
+from torch_xor import XORNeuralNetwork
+
+# -------------------------------------------------------------------
+# Configurable torch training / evaluation runner on noisy XOR
+# -------------------------------------------------------------------
+# Trains XORNeuralNetwork on a large synthetic dataset with mini-batches,
+# evaluates it in big batches under torch.inference_mode, lets you choose
+# the number of CPU threads, and checkpoints so a run can be resumed.
+
+
+class NoisyXORDataset(Dataset):
+    """XOR corners with Gaussian noise on the inputs, kept as two big tensors.
+
+    __getitems__ lets the DataLoader fetch a whole mini-batch with one
+    indexing operation instead of calling __getitem__ once per sample.
+    """
+
+    def __init__(self, n_samples, noise=0.1, seed=0):
+        generator = torch.Generator().manual_seed(seed)
+        bits = torch.randint(0, 2, (n_samples, 2), generator=generator)
+        self.inputs = bits.float() + noise * torch.randn(n_samples, 2, generator=generator)
+        self.outputs = (bits[:, 0] ^ bits[:, 1]).float().unsqueeze(1)
+
+    def __len__(self):
+        return len(self.inputs)
+
+    def __getitem__(self, i):
+        return self.inputs[i], self.outputs[i]
+
+    def __getitems__(self, indices):
+        indices = torch.as_tensor(indices)
+        return self.inputs[indices], self.outputs[indices]
+
+
+def _keep_batch(batch):
+    # __getitems__ already returns (inputs, outputs) for the whole batch
+    return batch
+
+
+def make_loader(dataset, batch_size, shuffle=True, workers=0, per_sample=False):
+    """DataLoader over dataset.
+
+    per_sample=True uses the stock per-sample fetch + default collate path,
+    which is only useful for comparing against the batched fetch.
+    """
+    if per_sample:
+        return DataLoader(TensorDataset(dataset.inputs, dataset.outputs),
+                          batch_size=batch_size, shuffle=shuffle, num_workers=workers)
+    return DataLoader(dataset, batch_size=batch_size, shuffle=shuffle,
+                      num_workers=workers, collate_fn=_keep_batch)
+
+
+def set_threads(threads):
+    """Intra-op threads; tiny models usually run fastest on very few."""
+    if threads:
+        torch.set_num_threads(threads)
+
+
+# -------------------------------------------------------------------
+# Training and evaluation
+# -------------------------------------------------------------------
+def train_one_epoch(model, loader, criterion, optimizer):
+    """Returns the number of samples trained on."""
+    model.train()
+    n_samples = 0
+    for x, y in loader:
+        loss = criterion(model(x), y)
+        optimizer.zero_grad(set_to_none=True)
+        loss.backward()
+        optimizer.step()
+        n_samples += len(x)
+    return n_samples
+
+
+def evaluate(model, dataset, batch_size=65536):
+    """Mean squared error and accuracy over dataset, in large batches."""
+    model.eval()
+    total_loss = 0.0
+    correct = 0
+    with torch.inference_mode():
+        for start in range(0, len(dataset), batch_size):
+            x = dataset.inputs[start:start + batch_size]
+            y = dataset.outputs[start:start + batch_size]
+            predictions = model(x)
+            total_loss += nn.functional.mse_loss(predictions, y, reduction="sum").item()
+            correct += (predictions.round() == y).sum().item()
+    n_values = dataset.outputs.numel()
+    return total_loss / n_values, correct / n_values
+
+
+def make_optimizer(name, model, learning_rate):
+    optimizers = {"sgd": torch.optim.SGD, "adam": torch.optim.Adam}
+    return optimizers[name](model.parameters(), lr=learning_rate)
+
+
+# -------------------------------------------------------------------
+# Checkpoints
+# -------------------------------------------------------------------
+# Arguments that determine the training state; resuming with different
+# values would silently continue a run that does not match them
+CHECKPOINT_CONFIG_KEYS = ("samples", "noise", "batch_size", "optimizer", "lr", "seed")
+
+
+def checkpoint_config(args):
+    return {key: getattr(args, key) for key in CHECKPOINT_CONFIG_KEYS}
+
+
+def save_checkpoint(path, model, optimizer, epoch, config):
+    checkpoint = {
+        "epoch": epoch,
+        "config": config,
+        "model": model.state_dict(),
+        "optimizer": optimizer.state_dict(),
+        "rng_state": torch.get_rng_state(),
+    }
+    # Write to a temporary file first so a crash never leaves a broken checkpoint
+    tmp_path = path + ".tmp"
+    torch.save(checkpoint, tmp_path)
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path, model, optimizer, config):
+    """Restore model, optimizer and RNG state; returns the epoch to continue from.
+
+    Raises ValueError if the checkpoint was written with a different config.
+    """
+    checkpoint = torch.load(path)
+    saved = checkpoint.get("config", {})
+    mismatches = [
+        f"{key}: checkpoint has {saved.get(key)!r}, run has {value!r}"
+        for key, value in config.items()
+        if saved.get(key) != value
+    ]
+    if mismatches:
+        raise ValueError(f"cannot resume from {path}, the run config differs:\n  "
+                         + "\n  ".join(mismatches))
+    model.load_state_dict(checkpoint["model"])
+    optimizer.load_state_dict(checkpoint["optimizer"])
+    torch.set_rng_state(checkpoint["rng_state"])
+    return checkpoint["epoch"]
+
+
+# -------------------------------------------------------------------
+# Runner
+# -------------------------------------------------------------------
+def run(args):
+    if args.resume:
+        if not args.checkpoint:
+            raise ValueError("--resume needs --checkpoint")
+        if not os.path.exists(args.checkpoint):
+            raise FileNotFoundError(f"no checkpoint to resume from at {args.checkpoint}")
+
+    set_threads(args.threads)
+    torch.manual_seed(args.seed)
+
+    train_set = NoisyXORDataset(args.samples, args.noise, seed=args.seed)
+    eval_set = NoisyXORDataset(args.eval_samples, args.noise, seed=args.seed + 1)
+    loader = make_loader(train_set, args.batch_size, workers=args.workers,
+                         per_sample=args.per_sample_loader)
+
+    model = XORNeuralNetwork()
+    criterion = nn.MSELoss()
+    optimizer = make_optimizer(args.optimizer, model, args.lr)
+
+    config = checkpoint_config(args)
+    start_epoch = 0
+    if args.resume:
+        start_epoch = load_checkpoint(args.checkpoint, model, optimizer, config)
+        print(f"Resumed from {args.checkpoint} at epoch {start_epoch}")
+
+    for epoch in range(start_epoch, args.epochs):
+        start = time.perf_counter()
+        n_samples = train_one_epoch(model, loader, criterion, optimizer)
+        train_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        loss, accuracy = evaluate(model, eval_set, args.eval_batch_size)
+        eval_seconds = time.perf_counter() - start
+
+        print(f"Epoch {epoch + 1}, Loss: {loss:.6f}, Accuracy: {accuracy:.4f}, "
+              f"train {n_samples / train_seconds:,.0f} samples/s, "
+              f"eval {len(eval_set) / eval_seconds:,.0f} samples/s")
+
+        # Every checkpoint_every epochs, and always after the last one so a
+        # later --resume never repeats finished work
+        last_epoch = epoch + 1 == args.epochs
+        periodic = args.checkpoint_every and (epoch + 1) % args.checkpoint_every == 0
+        if args.checkpoint and (periodic or last_epoch):
+            save_checkpoint(args.checkpoint, model, optimizer, epoch + 1, config)
+    return model
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Train XORNeuralNetwork on noisy XOR.")
+    parser.add_argument("--samples", type=int, default=1_000_000, help="training samples")
+    parser.add_argument("--eval-samples", type=int, default=100_000)
+    parser.add_argument("--noise", type=float, default=0.1)
+    parser.add_argument("--epochs", type=int, default=5)
+    parser.add_argument("--batch-size", type=int, default=1024)
+    parser.add_argument("--eval-batch-size", type=int, default=65536)
+    parser.add_argument("--optimizer", choices=["sgd", "adam"], default="adam")
+    parser.add_argument("--lr", type=float, default=0.01)
+    parser.add_argument("--threads", type=int, default=0,
+                        help="intra-op threads (0 keeps torch's default)")
+    parser.add_argument("--workers", type=int, default=0, help="DataLoader worker processes")
+    parser.add_argument("--per-sample-loader", action="store_true",
+                        help="fetch samples one by one (slow, for comparison)")
+    parser.add_argument("--checkpoint", help="checkpoint file")
+    parser.add_argument("--checkpoint-every", type=int, default=1,
+                        help="epochs between checkpoints (the last epoch is always saved)")
+    parser.add_argument("--resume", action="store_true",
+                        help="continue from --checkpoint (which must exist and match this run)")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser
+
+
+if __name__ == "__main__":
+    run(build_parser().parse_args())
@@ -0,0 +1,81 @@
+import torch
+import torch.nn as nn
+import torch.optim as optim
+
+from training import constant, fit
+
+# Define the XOR data
+inputs = torch.tensor([[0, 0], [0, 1], [1, 0], [1, 1]], dtype=torch.float32)
+outputs = torch.tensor([[0], [1], [1], [0]], dtype=torch.float32)
+
+# Define the neural network model
+class XORNeuralNetwork(nn.Module):
+    def __init__(self):
+        super(XORNeuralNetwork, self).__init__()
+        self.hidden1 = nn.Linear(2, 10)   # Input layer to hidden layer 1 with 10 nodes
+        self.hidden2 = nn.Linear(10, 8)   # Hidden layer 1 to hidden layer 2 with 8 nodes
+        self.output = nn.Linear(8, 1)     # Hidden layer 2 to output layer
+
+    def forward(self, x):
+        x = torch.relu(self.hidden1(x))   # ReLU activation for first hidden layer
+        x = torch.relu(self.hidden2(x))   # ReLU activation for second hidden layer
+        x = torch.sigmoid(self.output(x)) # Sigmoid activation for the output layer
+        return x
+
+
+def make_train_epoch(model, criterion, optimizer, inputs, outputs):
+    """One full-batch step per epoch, using the learning rate the driver passes in."""
+    def train_epoch(learning_rate):
+        for group in optimizer.param_groups:
+            group["lr"] = learning_rate
+        predictions = model(inputs)
+        loss = criterion(predictions, outputs)
+
+        # Backward pass and optimization
+        optimizer.zero_grad()
+        loss.backward()
+        optimizer.step()
+    return train_epoch
+
+
+def make_evaluate(model, criterion, inputs, outputs):
+    def evaluate():
+        with torch.inference_mode():
+            predictions = model(inputs)
+            loss = criterion(predictions, outputs).item()
+            accuracy = (predictions.round() == outputs).float().mean().item()
+        return loss, accuracy
+    return evaluate
+
+
+def main():
+    # Initialize the model, loss function, and optimizer
+    model = XORNeuralNetwork()
+    criterion = nn.MSELoss()              # Mean Squared Error loss
+    optimizer = optim.SGD(model.parameters(), lr=0.1)  # Stochastic Gradient Descent optimizer
+
+    # Training the model: at most 10000 epochs, the loss is checked every
+    # 1000 epochs and training stops once it is low enough or stops improving
+    report = fit(
+        make_train_epoch(model, criterion, optimizer, inputs, outputs),
+        make_evaluate(model, criterion, inputs, outputs),
+        max_epochs=10000,
+        schedule=constant(0.1),
+        eval_every=1000,
+        target_loss=1e-3,
+        patience=3,
+        min_delta=1e-5,
+    )
+    print(f"Stopped after {report['epochs']} epochs ({report['stop_reason']}) "
+          f"in {report['seconds']:.2f}s")
+
+    # Testing the model after training
+    print("\nTesting the trained neural network:")
+    with torch.inference_mode():  # No need to track gradients for testing
+        predictions = model(inputs)
+    for i in range(len(inputs)):
+        print(f"Input: {inputs[i].numpy()}, Predicted Output: {predictions[i].item():.4f}, Expected Output: {outputs[i].item()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import math
+import time
+
+# -------------------------------------------------------------------
+# Learning rate schedules
+# -------------------------------------------------------------------
+# A schedule is just a function epoch -> learning rate.
+
+def constant(learning_rate):
+    return lambda epoch: learning_rate
+
+def step_decay(learning_rate, factor=0.5, every=1000):
+    return lambda epoch: learning_rate * factor ** (epoch // every)
+
+def exponential_decay(learning_rate, rate=0.999):
+    return lambda epoch: learning_rate * rate ** epoch
+
+def cosine_decay(learning_rate, epochs, min_learning_rate=0.0):
+    def schedule(epoch):
+        progress = min(epoch / epochs, 1.0)
+        return min_learning_rate + (learning_rate - min_learning_rate) * 0.5 * (1 + math.cos(math.pi * progress))
+    return schedule
+
+
+# -------------------------------------------------------------------
+# Training driver
+# -------------------------------------------------------------------
+def fit(train_epoch, evaluate, max_epochs, schedule, eval_every=100,
+        target_loss=None, target_accuracy=None, patience=None, min_delta=0.0,
+        verbose=True):
+    """Train until a stopping rule fires or max_epochs is reached.
+
+    train_epoch(learning_rate) runs one epoch and evaluate() returns
+    (loss, accuracy), so the same driver works for the NumPy MLP and for
+    torch models. The loss is only evaluated every eval_every epochs (and
+    after the last one), and the stopping rules are checked at those points:
+
+    target_loss:      stop once loss <= target_loss
+    target_accuracy:  stop once accuracy >= target_accuracy
+    patience:         stop when the loss has not improved by more than
+                      min_delta for this many evaluations in a row
+
+    Returns a report dict with the number of epochs trained, why training
+    stopped, the final loss and accuracy, wall time and the evaluation history.
+    """
+    best_loss = math.inf
+    evals_without_improvement = 0
+    stop_reason = "max_epochs"
+    history = []
+
+    start = time.perf_counter()
+    epoch = 0
+    while epoch < max_epochs:
+        train_epoch(schedule(epoch))
+        epoch += 1
+        if epoch % eval_every != 0 and epoch != max_epochs:
+            continue
+
+        loss, accuracy = evaluate()
+        history.append((epoch, loss, accuracy))
+        if verbose:
+            print(f"Epoch {epoch}, Loss: {loss}, Accuracy: {accuracy:.2f}")
+
+        if target_loss is not None and loss <= target_loss:
+            stop_reason = "target_loss"
+            break
+        if target_accuracy is not None and accuracy >= target_accuracy:
+            stop_reason = "target_accuracy"
+            break
+        if loss < best_loss - min_delta:
+            best_loss = loss
+            evals_without_improvement = 0
+        else:
+            evals_without_improvement += 1
+            if patience is not None and evals_without_improvement >= patience:
+                stop_reason = "plateau"
+                break
+    seconds = time.perf_counter() - start
+
+    if history and history[-1][0] == epoch:
+        loss, accuracy = history[-1][1:]
+    else:
+        loss, accuracy = evaluate()
+    return {
+        "epochs": epoch,
+        "stop_reason": stop_reason,
+        "loss": loss,
+        "accuracy": accuracy,
+        "seconds": seconds,
+        "history": history,
+    }